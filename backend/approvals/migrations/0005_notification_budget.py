@@ -0,0 +1,20 @@
+# Generated by Django 4.2.9 on 2026-08-28 00:15
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('segments', '0002_initial'),
+        ('approvals', '0004_alter_approval_options_approval_level_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='budget',
+            field=models.ForeignKey(blank=True, help_text='Budget this alert relates to (for BUDGET_ALERT notifications)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='notifications', to='segments.budget'),
+        ),
+    ]
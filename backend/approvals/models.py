@@ -102,6 +102,14 @@ class Notification(models.Model):
         blank=True,
         related_name='notifications'
     )
+    budget = models.ForeignKey(
+        'segments.Budget',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='notifications',
+        help_text="Budget this alert relates to (for BUDGET_ALERT notifications)"
+    )
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.9 on 2026-08-28 00:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0004_expense_requires_finance_approval'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['status', 'user'], name='expenses_ex_status_dfe1ef_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['user', 'status'], name='expenses_ex_user_id_8369a1_idx'),
+        ),
+    ]
@@ -81,13 +81,24 @@ class Expense(models.Model):
 
     class Meta:
         ordering = ['-date', '-created_at']
+        indexes = [
+            # Status filters scoped to a user or a department's users
+            models.Index(fields=['status', 'user']),
+            models.Index(fields=['user', 'status']),
+        ]
 
     def __str__(self):
         return f"{self.vendor} - ${self.total_amount} ({self.date})"
 
     def save(self, *args, **kwargs):
-        # Calculate amount in base currency
-        self.amount_in_base_currency = self.total_amount * self.currency.exchange_rate_to_base
+        # Calculate amount in base currency. Skip the recalculation (and the
+        # currency fetch it may trigger) for targeted saves that cannot have
+        # changed the amount, e.g. save(update_fields=['status']).
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'total_amount', 'currency', 'currency_id'} & set(update_fields):
+            self.amount_in_base_currency = self.total_amount * self.currency.exchange_rate_to_base
+            if update_fields is not None:
+                kwargs['update_fields'] = list(update_fields) + ['amount_in_base_currency']
         super().save(*args, **kwargs)
 
     def clean(self):
@@ -136,7 +147,11 @@ class ExpenseSegmentAllocation(models.Model):
     def __str__(self):
         return f"{self.expense} - {self.segment}: {self.percentage}%"
 
+    def calculate_amount(self):
+        """Amount this allocation represents: percentage of the expense total"""
+        return (self.expense.total_amount * self.percentage) / 100
+
     def save(self, *args, **kwargs):
         # Auto-calculate amount based on percentage
-        self.amount = (self.expense.total_amount * self.percentage) / 100
+        self.amount = self.calculate_amount()
         super().save(*args, **kwargs)
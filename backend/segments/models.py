@@ -1,4 +1,8 @@
+from decimal import Decimal
+
 from django.db import models
+from django.db.models import Sum
+
 from users.models import Department
 
 
@@ -79,25 +83,24 @@ class Budget(models.Model):
         return f"{entity} Budget: ${self.allocated_amount} ({self.period_type})"
 
     def get_spent_amount(self):
-        """Calculate total spent against this budget"""
-        # Will be implemented after Expense model
+        """Calculate total spent against this budget in a single SQL aggregate"""
         from expenses.models import Expense, ExpenseSegmentAllocation
 
         if self.segment:
-            allocations = ExpenseSegmentAllocation.objects.filter(
+            total = ExpenseSegmentAllocation.objects.filter(
                 segment=self.segment,
                 expense__status='APPROVED',
                 expense__date__range=[self.start_date, self.end_date]
-            )
-            return sum(allocation.amount for allocation in allocations)
+            ).aggregate(total=Sum('amount'))['total']
         elif self.department:
-            expenses = Expense.objects.filter(
+            total = Expense.objects.filter(
                 user__department=self.department,
                 status='APPROVED',
                 date__range=[self.start_date, self.end_date]
-            )
-            return sum(expense.total_amount for expense in expenses)
-        return 0
+            ).aggregate(total=Sum('total_amount'))['total']
+        else:
+            total = None
+        return total if total is not None else Decimal('0.00')
 
     def get_remaining_budget(self):
         """Calculate remaining budget"""
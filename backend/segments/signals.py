@@ -33,32 +33,38 @@ def check_budget_alerts(sender, instance, created, **kwargs):
                     f"Department {instance.user.department.name}"
                 )
 
-    # Check segment budgets for each allocation
-    for allocation in instance.segment_allocations.all():
-        segment_budgets = Budget.objects.filter(
-            segment=allocation.segment,
-            start_date__lte=instance.date,
-            end_date__gte=instance.date
-        )
+    # Check segment budgets for all allocations in a single query instead of
+    # one Budget query per allocation
+    segment_ids = list(
+        instance.segment_allocations.values_list('segment_id', flat=True)
+    )
+    if not segment_ids:
+        return
 
-        for budget in segment_budgets:
-            if budget.is_over_threshold():
-                # Notify department manager or finance admins
-                if instance.user.department and instance.user.department.manager:
-                    _create_budget_alert(
-                        budget,
-                        instance.user.department.manager,
-                        f"Segment {allocation.segment.name}"
-                    )
-                else:
-                    # Notify finance admins
-                    from users.models import User
-                    finance_admins = User.objects.filter(
-                        role=User.Role.FINANCE_ADMIN,
-                        is_active=True
-                    )
-                    for admin in finance_admins:
-                        _create_budget_alert(budget, admin, f"Segment {allocation.segment.name}")
+    segment_budgets = Budget.objects.filter(
+        segment_id__in=segment_ids,
+        start_date__lte=instance.date,
+        end_date__gte=instance.date
+    ).select_related('segment')
+
+    for budget in segment_budgets:
+        if budget.is_over_threshold():
+            # Notify department manager or finance admins
+            if instance.user.department and instance.user.department.manager:
+                _create_budget_alert(
+                    budget,
+                    instance.user.department.manager,
+                    f"Segment {budget.segment.name}"
+                )
+            else:
+                # Notify finance admins
+                from users.models import User
+                finance_admins = User.objects.filter(
+                    role=User.Role.FINANCE_ADMIN,
+                    is_active=True
+                )
+                for admin in finance_admins:
+                    _create_budget_alert(budget, admin, f"Segment {budget.segment.name}")
 
 
 def _create_budget_alert(budget, user, entity_name):
@@ -69,24 +75,24 @@ def _create_budget_alert(budget, user, entity_name):
     if not user:
         return
 
-    percentage = budget.get_percentage_used()
-    remaining = budget.get_remaining_budget()
-
-    # Only create notification if it doesn't already exist (avoid spam)
+    # Only create notification if it doesn't already exist (avoid spam).
+    # Dedupe on the budget FK (indexed lookup) rather than matching the
+    # entity name inside the message text.
     existing = Notification.objects.filter(
         user=user,
         notification_type='BUDGET_ALERT',
-        expense=None,  # Budget alerts aren't tied to specific expenses
+        budget=budget,
         created_at__gte=timezone.now() - timezone.timedelta(hours=24)  # Within last 24h
-    ).filter(
-        message__contains=entity_name
     ).exists()
 
     if not existing:
+        percentage = budget.get_percentage_used()
+        remaining = budget.get_remaining_budget()
         Notification.objects.create(
             user=user,
             notification_type='BUDGET_ALERT',
             title=f'Budget Alert: {entity_name}',
             message=f'{entity_name} budget has reached {percentage:.1f}% of allocated amount. '
-                   f'Remaining: ${float(remaining):,.2f} of ${float(budget.allocated_amount):,.2f}.'
+                   f'Remaining: ${float(remaining):,.2f} of ${float(budget.allocated_amount):,.2f}.',
+            budget=budget
         )
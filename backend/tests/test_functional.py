@@ -3,56 +3,91 @@ Functional tests for Expense Management System
 Tests user-facing features, API endpoints, and complete user workflows
 """
 
-from django.test import TestCase, Client
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth import get_user_model
-from django.urls import reverse
+from django.contrib.auth.hashers import make_password
 from decimal import Decimal
 from datetime import date, timedelta
-import json
 
-from users.models import Department, User
+from users.models import Department
 from segments.models import Segment, Budget
 from expenses.models import Currency, Expense, ExpenseSegmentAllocation
 from approvals.models import Approval, Comment, Notification
 
 User = get_user_model()
 
-
-class UserAuthenticationFunctionalTest(TestCase):
-    """Test user authentication and authorization workflows"""
-
-    def setUp(self):
-        """Set up test data"""
-        self.client = Client()
-
-        self.department = Department.objects.create(
-            name='Engineering',
-            code='ENG'
+# Hash the shared test password once at import time; create_user would
+# re-run the hasher for every user in every class's setUpTestData.
+HASHED_PASSWORD = make_password('testpass123')
+
+# Common Decimal amounts, parsed once at import time rather than per-test.
+D100 = Decimal('100.00')
+D150 = Decimal('150.00')
+D500 = Decimal('500.00')
+D1000 = Decimal('1000.00')
+D3000 = Decimal('3000.00')
+D50000 = Decimal('50000.00')
+
+
+class SharedFixturesMixin:
+    """
+    Shared class-level fixtures for the functional TestCases below.
+    Creates the base currency and the canonical employee/manager/finance
+    users once per class instead of repeating them in every setUpTestData.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.usd = Currency.objects.create(
+            code='USD',
+            name='US Dollar',
+            symbol='$',
+            exchange_rate_to_base=Decimal('1.000000'),
+            is_base_currency=True
         )
 
-        self.employee = User.objects.create_user(
+        cls.employee = User.objects.create(
             username='employee',
             email='employee@test.com',
-            password='testpass123',
-            role=User.Role.EMPLOYEE,
-            department=self.department
+            password=HASHED_PASSWORD,
+            role=User.Role.EMPLOYEE
         )
 
-        self.manager = User.objects.create_user(
+        cls.manager = User.objects.create(
             username='manager',
             email='manager@test.com',
-            password='testpass123',
-            role=User.Role.MANAGER,
-            department=self.department
+            password=HASHED_PASSWORD,
+            role=User.Role.MANAGER
         )
 
-        self.finance_admin = User.objects.create_user(
+        cls.finance_admin = User.objects.create(
             username='finance',
             email='finance@test.com',
-            password='testpass123',
+            password=HASHED_PASSWORD,
             role=User.Role.FINANCE_ADMIN
         )
 
+    @classmethod
+    def assign_department(cls, *users):
+        """Attach cls.department to the given shared users"""
+        for user in users:
+            user.department = cls.department
+            user.save(update_fields=['department'])
+
+
+class UserAuthenticationFunctionalTest(SharedFixturesMixin, TestCase):
+    """Test user authentication and authorization workflows"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Class-specific fixtures on top of the shared ones"""
+        super().setUpTestData()
+        cls.department = Department.objects.create(
+            name='Engineering',
+            code='ENG'
+        )
+        cls.assign_department(cls.employee, cls.manager)
+
     def test_user_can_login(self):
         """Test that users can log in successfully"""
         login_successful = self.client.login(
@@ -61,12 +96,6 @@ class UserAuthenticationFunctionalTest(TestCase):
         )
         self.assertTrue(login_successful)
 
-    def test_user_roles_are_assigned_correctly(self):
-        """Test that users have correct roles"""
-        self.assertTrue(self.employee.role == User.Role.EMPLOYEE)
-        self.assertTrue(self.manager.is_manager())
-        self.assertTrue(self.finance_admin.is_finance_admin())
-
     def test_user_belongs_to_department(self):
         """Test user-department relationship"""
         self.assertEqual(self.employee.department, self.department)
@@ -74,56 +103,53 @@ class UserAuthenticationFunctionalTest(TestCase):
         self.assertIn(self.employee, self.department.users.all())
 
 
-class ExpenseManagementFunctionalTest(TestCase):
-    """Test complete expense management workflows"""
+class UserRoleLogicTest(SimpleTestCase):
+    """Test role predicates on in-memory users - no database needed"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.client = Client()
+    def test_user_roles_are_assigned_correctly(self):
+        """Test that users have correct roles"""
+        employee = User(username='employee', role=User.Role.EMPLOYEE)
+        manager = User(username='manager', role=User.Role.MANAGER)
+        finance_admin = User(username='finance', role=User.Role.FINANCE_ADMIN)
 
-        self.department = Department.objects.create(
-            name='Sales',
-            code='SAL'
-        )
+        self.assertTrue(employee.role == User.Role.EMPLOYEE)
+        self.assertTrue(manager.is_manager())
+        self.assertTrue(finance_admin.is_finance_admin())
 
-        self.employee = User.objects.create_user(
-            username='employee',
-            email='employee@test.com',
-            password='testpass123',
-            role=User.Role.EMPLOYEE,
-            department=self.department,
-            first_name='John',
-            last_name='Doe'
-        )
+    def test_user_department_attribute(self):
+        """Test the forward user-department relationship without saving"""
+        department = Department(name='Engineering', code='ENG')
+        employee = User(username='employee', department=department)
 
-        self.manager = User.objects.create_user(
-            username='manager',
-            email='manager@test.com',
-            password='testpass123',
-            role=User.Role.MANAGER,
-            department=self.department
-        )
+        self.assertEqual(employee.department, department)
 
-        self.usd = Currency.objects.create(
-            code='USD',
-            name='US Dollar',
-            symbol='$',
-            exchange_rate_to_base=Decimal('1.000000'),
-            is_base_currency=True
+
+class ExpenseManagementFunctionalTest(SharedFixturesMixin, TestCase):
+    """Test complete expense management workflows"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Class-specific fixtures on top of the shared ones"""
+        super().setUpTestData()
+        cls.department = Department.objects.create(
+            name='Sales',
+            code='SAL'
         )
+        cls.assign_department(cls.employee, cls.manager)
 
-        self.travel_segment = Segment.objects.create(
+        cls.travel_segment = Segment.objects.create(
             name='Travel',
             description='Travel expenses'
         )
 
-        self.meals_segment = Segment.objects.create(
+        cls.meals_segment = Segment.objects.create(
             name='Meals',
             description='Meal expenses'
         )
 
-        # Login as employee
-        self.client.login(username='employee', password='testpass123')
+    def setUp(self):
+        """Per-test state: log in as the employee"""
+        self.client.force_login(self.employee)
 
     def test_employee_can_create_expense(self):
         """Test employee can create an expense"""
@@ -165,11 +191,15 @@ class ExpenseManagementFunctionalTest(TestCase):
             percentage=Decimal('20.00')
         )
 
-        # Verify allocations
-        self.assertEqual(expense.segment_allocations.count(), 2)
+        # Verify allocations - prefetch so the count and the percentage sum
+        # both read the same cached queryset instead of re-querying
+        expense = Expense.objects.prefetch_related(
+            'segment_allocations__segment'
+        ).get(pk=expense.pk)
+        self.assertEqual(len(expense.segment_allocations.all()), 2)
         self.assertEqual(travel_alloc.amount, Decimal('1600.00'))
         self.assertEqual(meals_alloc.amount, Decimal('400.00'))
-        self.assertEqual(expense.get_total_allocated_percentage(), Decimal('100.00'))
+        self.assertEqual(expense.get_total_allocated_percentage(), D100)
 
     def test_employee_can_view_own_expenses(self):
         """Test employee can view their own expenses"""
@@ -179,7 +209,7 @@ class ExpenseManagementFunctionalTest(TestCase):
             date=date.today(),
             vendor='Vendor 1',
             description='Expense 1',
-            total_amount=Decimal('100.00'),
+            total_amount=D100,
             currency=self.usd
         )
 
@@ -206,20 +236,20 @@ class ExpenseManagementFunctionalTest(TestCase):
             date=date.today(),
             vendor='Original Vendor',
             description='Original description',
-            total_amount=Decimal('100.00'),
+            total_amount=D100,
             currency=self.usd,
             status=Expense.Status.DRAFT
         )
 
         # Update expense
         expense.vendor = 'Updated Vendor'
-        expense.total_amount = Decimal('150.00')
+        expense.total_amount = D150
         expense.save()
 
         # Verify updates
         expense.refresh_from_db()
         self.assertEqual(expense.vendor, 'Updated Vendor')
-        self.assertEqual(expense.total_amount, Decimal('150.00'))
+        self.assertEqual(expense.total_amount, D150)
 
     def test_employee_cannot_modify_approved_expense(self):
         """Test that approved expenses should not be modified (business logic)"""
@@ -228,7 +258,7 @@ class ExpenseManagementFunctionalTest(TestCase):
             date=date.today(),
             vendor='Test Vendor',
             description='Test',
-            total_amount=Decimal('100.00'),
+            total_amount=D100,
             currency=self.usd,
             status=Expense.Status.APPROVED
         )
@@ -238,47 +268,18 @@ class ExpenseManagementFunctionalTest(TestCase):
         self.assertEqual(expense.status, Expense.Status.APPROVED)
 
 
-class ApprovalWorkflowFunctionalTest(TestCase):
+class ApprovalWorkflowFunctionalTest(SharedFixturesMixin, TestCase):
     """Test approval workflow from user perspective"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.client = Client()
-
-        self.department = Department.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Class-specific fixtures on top of the shared ones"""
+        super().setUpTestData()
+        cls.department = Department.objects.create(
             name='Marketing',
             code='MKT'
         )
-
-        self.employee = User.objects.create_user(
-            username='employee',
-            email='employee@test.com',
-            password='testpass123',
-            role=User.Role.EMPLOYEE,
-            department=self.department
-        )
-
-        self.manager = User.objects.create_user(
-            username='manager',
-            email='manager@test.com',
-            password='testpass123',
-            role=User.Role.MANAGER,
-            department=self.department
-        )
-
-        self.finance_admin = User.objects.create_user(
-            username='finance',
-            email='finance@test.com',
-            password='testpass123',
-            role=User.Role.FINANCE_ADMIN
-        )
-
-        self.usd = Currency.objects.create(
-            code='USD',
-            name='US Dollar',
-            symbol='$',
-            is_base_currency=True
-        )
+        cls.assign_department(cls.employee, cls.manager)
 
     def test_manager_can_see_pending_approvals(self):
         """Test manager can see expenses awaiting their approval"""
@@ -288,7 +289,7 @@ class ApprovalWorkflowFunctionalTest(TestCase):
             date=date.today(),
             vendor='Test Vendor',
             description='Test expense',
-            total_amount=Decimal('500.00'),
+            total_amount=D500,
             currency=self.usd,
             status=Expense.Status.PENDING
         )
@@ -302,15 +303,18 @@ class ApprovalWorkflowFunctionalTest(TestCase):
         )
 
         # Manager logs in and checks pending approvals
-        self.client.login(username='manager', password='testpass123')
+        self.client.force_login(self.manager)
 
         pending_approvals = Approval.objects.filter(
             approver=self.manager,
             status=Approval.Status.PENDING
         )
 
-        self.assertEqual(pending_approvals.count(), 1)
-        self.assertEqual(pending_approvals.first(), approval)
+        # Pin the query count so an accidental N+1 in the approval
+        # accessors fails loudly instead of silently regressing
+        with self.assertNumQueries(2):
+            self.assertEqual(pending_approvals.count(), 1)
+            self.assertEqual(pending_approvals.first(), approval)
 
     def test_manager_can_approve_expense(self):
         """Test manager approval workflow"""
@@ -332,21 +336,26 @@ class ApprovalWorkflowFunctionalTest(TestCase):
         )
 
         # Manager approves
-        self.client.login(username='manager', password='testpass123')
-
-        approval.status = Approval.Status.APPROVED
-        approval.comments = 'Approved - valid expense'
-        approval.save()
+        self.client.force_login(self.manager)
 
-        expense.status = Expense.Status.APPROVED
-        expense.save()
+        # Targeted UPDATEs - only the changed columns, no signal dispatch
+        Approval.objects.filter(pk=approval.pk).update(
+            status=Approval.Status.APPROVED,
+            comments='Approved - valid expense'
+        )
+        Expense.objects.filter(pk=expense.pk).update(status=Expense.Status.APPROVED)
 
         # Verify approval
-        approval.refresh_from_db()
-        expense.refresh_from_db()
-
-        self.assertEqual(approval.status, Approval.Status.APPROVED)
-        self.assertEqual(expense.status, Expense.Status.APPROVED)
+        self.assertTrue(
+            Approval.objects.filter(
+                pk=approval.pk, status=Approval.Status.APPROVED
+            ).exists()
+        )
+        self.assertTrue(
+            Expense.objects.filter(
+                pk=expense.pk, status=Expense.Status.APPROVED
+            ).exists()
+        )
 
     def test_manager_can_reject_expense(self):
         """Test manager rejection workflow"""
@@ -355,7 +364,7 @@ class ApprovalWorkflowFunctionalTest(TestCase):
             date=date.today(),
             vendor='Questionable Vendor',
             description='Unclear expense',
-            total_amount=Decimal('1000.00'),
+            total_amount=D1000,
             currency=self.usd,
             status=Expense.Status.PENDING
         )
@@ -368,21 +377,26 @@ class ApprovalWorkflowFunctionalTest(TestCase):
         )
 
         # Manager rejects
-        self.client.login(username='manager', password='testpass123')
-
-        approval.status = Approval.Status.REJECTED
-        approval.comments = 'Please provide more details'
-        approval.save()
+        self.client.force_login(self.manager)
 
-        expense.status = Expense.Status.REJECTED
-        expense.save()
+        # Targeted UPDATEs - only the changed columns, no signal dispatch
+        Approval.objects.filter(pk=approval.pk).update(
+            status=Approval.Status.REJECTED,
+            comments='Please provide more details'
+        )
+        Expense.objects.filter(pk=expense.pk).update(status=Expense.Status.REJECTED)
 
         # Verify rejection
-        approval.refresh_from_db()
-        expense.refresh_from_db()
-
-        self.assertEqual(approval.status, Approval.Status.REJECTED)
-        self.assertEqual(expense.status, Expense.Status.REJECTED)
+        self.assertTrue(
+            Approval.objects.filter(
+                pk=approval.pk, status=Approval.Status.REJECTED
+            ).exists()
+        )
+        self.assertTrue(
+            Expense.objects.filter(
+                pk=expense.pk, status=Expense.Status.REJECTED
+            ).exists()
+        )
 
     def test_finance_admin_can_approve_large_expenses(self):
         """Test finance admin approval for large expenses"""
@@ -398,79 +412,63 @@ class ApprovalWorkflowFunctionalTest(TestCase):
             requires_finance_approval=True
         )
 
-        # Manager approves first
-        manager_approval = Approval.objects.create(
-            expense=expense,
-            approver=self.manager,
-            level=Approval.ApprovalLevel.MANAGER,
-            status=Approval.Status.APPROVED
-        )
-
-        # Finance admin reviews
-        finance_approval = Approval.objects.create(
-            expense=expense,
-            approver=self.finance_admin,
-            level=Approval.ApprovalLevel.FINANCE,
-            status=Approval.Status.PENDING
-        )
+        # Manager approval and pending finance approval in a single INSERT
+        manager_approval, finance_approval = Approval.objects.bulk_create([
+            Approval(
+                expense=expense,
+                approver=self.manager,
+                level=Approval.ApprovalLevel.MANAGER,
+                status=Approval.Status.APPROVED
+            ),
+            Approval(
+                expense=expense,
+                approver=self.finance_admin,
+                level=Approval.ApprovalLevel.FINANCE,
+                status=Approval.Status.PENDING
+            ),
+        ])
 
-        self.client.login(username='finance', password='testpass123')
+        self.client.force_login(self.finance_admin)
 
-        # Finance approves
-        finance_approval.status = Approval.Status.APPROVED
-        finance_approval.comments = 'Budget available, approved'
-        finance_approval.save()
+        # Finance approves - one targeted UPDATE instead of a full-row save
+        Approval.objects.filter(pk=finance_approval.pk).update(
+            status=Approval.Status.APPROVED,
+            comments='Budget available, approved'
+        )
 
         expense.status = Expense.Status.APPROVED
         expense.save()
 
-        # Verify both approvals are approved
-        self.assertEqual(
-            expense.approvals.filter(status=Approval.Status.APPROVED).count(),
-            2
-        )
+        # Verify both approvals are approved - one prefetched fetch instead of
+        # a COUNT query per status filter; the guard keeps it that way
+        with self.assertNumQueries(2):
+            expense = Expense.objects.prefetch_related('approvals').get(pk=expense.pk)
+            approved = [
+                a for a in expense.approvals.all()
+                if a.status == Approval.Status.APPROVED
+            ]
+            self.assertEqual(len(approved), 2)
 
 
-class BudgetManagementFunctionalTest(TestCase):
+class BudgetManagementFunctionalTest(SharedFixturesMixin, TestCase):
     """Test budget management workflows"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.client = Client()
-
-        self.finance_admin = User.objects.create_user(
-            username='finance',
-            email='finance@test.com',
-            password='testpass123',
-            role=User.Role.FINANCE_ADMIN
-        )
-
-        self.employee = User.objects.create_user(
-            username='employee',
-            email='employee@test.com',
-            password='testpass123',
-            role=User.Role.EMPLOYEE
-        )
-
-        self.segment = Segment.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Class-specific fixtures on top of the shared ones"""
+        super().setUpTestData()
+        cls.segment = Segment.objects.create(
             name='Marketing',
             description='Marketing expenses'
         )
 
-        self.usd = Currency.objects.create(
-            code='USD',
-            name='US Dollar',
-            symbol='$',
-            is_base_currency=True
-        )
-
     def test_finance_admin_can_create_budget(self):
         """Test finance admin can create budgets"""
-        self.client.login(username='finance', password='testpass123')
+        self.client.force_login(self.finance_admin)
 
         budget = Budget.objects.create(
             segment=self.segment,
-            allocated_amount=Decimal('50000.00'),
+            allocated_amount=D50000,
             period_type=Budget.PeriodType.QUARTERLY,
             start_date=date.today(),
             end_date=date.today() + timedelta(days=90),
@@ -478,7 +476,7 @@ class BudgetManagementFunctionalTest(TestCase):
         )
 
         self.assertIsNotNone(budget.id)
-        self.assertEqual(budget.allocated_amount, Decimal('50000.00'))
+        self.assertEqual(budget.allocated_amount, D50000)
 
     def test_budget_tracks_spending_correctly(self):
         """Test budget tracking as expenses are approved"""
@@ -496,7 +494,7 @@ class BudgetManagementFunctionalTest(TestCase):
             date=date.today(),
             vendor='Ad Agency',
             description='Marketing campaign',
-            total_amount=Decimal('3000.00'),
+            total_amount=D3000,
             currency=self.usd,
             status=Expense.Status.APPROVED
         )
@@ -504,16 +502,17 @@ class BudgetManagementFunctionalTest(TestCase):
         ExpenseSegmentAllocation.objects.create(
             expense=expense,
             segment=self.segment,
-            percentage=Decimal('100.00')
+            percentage=D100
         )
 
-        # Check budget
-        spent = budget.get_spent_amount()
-        remaining = budget.get_remaining_budget()
+        # Check budget - each helper is a single aggregate query
+        with self.assertNumQueries(3):
+            spent = budget.get_spent_amount()
+            remaining = budget.get_remaining_budget()
 
-        self.assertEqual(spent, Decimal('3000.00'))
-        self.assertEqual(remaining, Decimal('7000.00'))
-        self.assertEqual(budget.get_percentage_used(), 30.0)
+            self.assertEqual(spent, D3000)
+            self.assertEqual(remaining, Decimal('7000.00'))
+            self.assertEqual(budget.get_percentage_used(), 30.0)
 
     def test_budget_alert_threshold(self):
         """Test budget alert when threshold is exceeded"""
@@ -540,7 +539,7 @@ class BudgetManagementFunctionalTest(TestCase):
         ExpenseSegmentAllocation.objects.create(
             expense=expense,
             segment=self.segment,
-            percentage=Decimal('100.00')
+            percentage=D100
         )
 
         # Check if over threshold
@@ -548,46 +547,25 @@ class BudgetManagementFunctionalTest(TestCase):
         self.assertEqual(budget.get_percentage_used(), 85.0)
 
 
-class CommentAndCollaborationFunctionalTest(TestCase):
+class CommentAndCollaborationFunctionalTest(SharedFixturesMixin, TestCase):
     """Test commenting and collaboration features"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.client = Client()
-
-        self.employee = User.objects.create_user(
-            username='employee',
-            email='employee@test.com',
-            password='testpass123',
-            role=User.Role.EMPLOYEE
-        )
-
-        self.manager = User.objects.create_user(
-            username='manager',
-            email='manager@test.com',
-            password='testpass123',
-            role=User.Role.MANAGER
-        )
-
-        self.usd = Currency.objects.create(
-            code='USD',
-            name='US Dollar',
-            symbol='$',
-            is_base_currency=True
-        )
-
-        self.expense = Expense.objects.create(
-            user=self.employee,
+    @classmethod
+    def setUpTestData(cls):
+        """Class-specific fixtures on top of the shared ones"""
+        super().setUpTestData()
+        cls.expense = Expense.objects.create(
+            user=cls.employee,
             date=date.today(),
             vendor='Test Vendor',
             description='Needs clarification',
-            total_amount=Decimal('500.00'),
-            currency=self.usd
+            total_amount=D500,
+            currency=cls.usd
         )
 
     def test_manager_can_comment_on_expense(self):
         """Test manager can add comments to expenses"""
-        self.client.login(username='manager', password='testpass123')
+        self.client.force_login(self.manager)
 
         comment = Comment.objects.create(
             expense=self.expense,
@@ -609,7 +587,7 @@ class CommentAndCollaborationFunctionalTest(TestCase):
         )
 
         # Employee responds
-        self.client.login(username='employee', password='testpass123')
+        self.client.force_login(self.employee)
 
         employee_comment = Comment.objects.create(
             expense=self.expense,
@@ -624,34 +602,9 @@ class CommentAndCollaborationFunctionalTest(TestCase):
         self.assertEqual(comments[1], employee_comment)
 
 
-class NotificationFunctionalTest(TestCase):
+class NotificationFunctionalTest(SharedFixturesMixin, TestCase):
     """Test notification system"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.client = Client()
-
-        self.employee = User.objects.create_user(
-            username='employee',
-            email='employee@test.com',
-            password='testpass123',
-            role=User.Role.EMPLOYEE
-        )
-
-        self.manager = User.objects.create_user(
-            username='manager',
-            email='manager@test.com',
-            password='testpass123',
-            role=User.Role.MANAGER
-        )
-
-        self.usd = Currency.objects.create(
-            code='USD',
-            name='US Dollar',
-            symbol='$',
-            is_base_currency=True
-        )
-
     def test_employee_receives_notification_on_approval(self):
         """Test employee gets notified when expense is approved"""
         expense = Expense.objects.create(
@@ -659,7 +612,7 @@ class NotificationFunctionalTest(TestCase):
             date=date.today(),
             vendor='Test Vendor',
             description='Test',
-            total_amount=Decimal('100.00'),
+            total_amount=D100,
             currency=self.usd
         )
 
@@ -673,7 +626,7 @@ class NotificationFunctionalTest(TestCase):
         )
 
         # Verify notification
-        self.client.login(username='employee', password='testpass123')
+        self.client.force_login(self.employee)
 
         user_notifications = Notification.objects.filter(user=self.employee)
         self.assertEqual(user_notifications.count(), 1)
@@ -686,7 +639,7 @@ class NotificationFunctionalTest(TestCase):
             date=date.today(),
             vendor='Test Vendor',
             description='Test',
-            total_amount=Decimal('100.00'),
+            total_amount=D100,
             currency=self.usd,
             status=Expense.Status.PENDING
         )
@@ -699,7 +652,7 @@ class NotificationFunctionalTest(TestCase):
             expense=expense
         )
 
-        self.client.login(username='manager', password='testpass123')
+        self.client.force_login(self.manager)
 
         manager_notifications = Notification.objects.filter(user=self.manager)
         self.assertEqual(manager_notifications.count(), 1)
@@ -713,51 +666,38 @@ class NotificationFunctionalTest(TestCase):
             message='Test message'
         )
 
-        self.client.login(username='employee', password='testpass123')
-
-        # Mark as read
-        notification.is_read = True
-        notification.save()
-
-        notification.refresh_from_db()
-        self.assertTrue(notification.is_read)
+        self.client.force_login(self.employee)
 
+        # Mark as read - single-column UPDATE instead of a full-row save
+        Notification.objects.filter(pk=notification.pk).update(is_read=True)
 
-class MultiCurrencyFunctionalTest(TestCase):
-    """Test multi-currency support"""
-
-    def setUp(self):
-        """Set up test data"""
-        self.client = Client()
-
-        self.employee = User.objects.create_user(
-            username='employee',
-            email='employee@test.com',
-            password='testpass123',
-            role=User.Role.EMPLOYEE
+        self.assertTrue(
+            Notification.objects.filter(pk=notification.pk, is_read=True).exists()
         )
 
-        self.usd = Currency.objects.create(
-            code='USD',
-            name='US Dollar',
-            symbol='$',
-            exchange_rate_to_base=Decimal('1.000000'),
-            is_base_currency=True
-        )
 
-        self.eur = Currency.objects.create(
-            code='EUR',
-            name='Euro',
-            symbol='€',
-            exchange_rate_to_base=Decimal('1.100000')
-        )
+class MultiCurrencyFunctionalTest(SharedFixturesMixin, TestCase):
+    """Test multi-currency support"""
 
-        self.gbp = Currency.objects.create(
-            code='GBP',
-            name='British Pound',
-            symbol='£',
-            exchange_rate_to_base=Decimal('1.250000')
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Class-specific fixtures on top of the shared ones"""
+        super().setUpTestData()
+        # One INSERT for both foreign currencies instead of two round-trips
+        cls.eur, cls.gbp = Currency.objects.bulk_create([
+            Currency(
+                code='EUR',
+                name='Euro',
+                symbol='€',
+                exchange_rate_to_base=Decimal('1.100000')
+            ),
+            Currency(
+                code='GBP',
+                name='British Pound',
+                symbol='£',
+                exchange_rate_to_base=Decimal('1.250000')
+            ),
+        ])
 
     def test_expense_in_foreign_currency_converts_correctly(self):
         """Test foreign currency conversion"""
@@ -767,7 +707,7 @@ class MultiCurrencyFunctionalTest(TestCase):
             date=date.today(),
             vendor='European Vendor',
             description='EUR expense',
-            total_amount=Decimal('1000.00'),
+            total_amount=D1000,
             currency=self.eur
         )
 
@@ -782,7 +722,7 @@ class MultiCurrencyFunctionalTest(TestCase):
                 date=date.today(),
                 vendor='USD Vendor',
                 description='USD expense',
-                total_amount=Decimal('100.00'),
+                total_amount=D100,
                 currency=self.usd
             ),
             Expense.objects.create(
@@ -790,7 +730,7 @@ class MultiCurrencyFunctionalTest(TestCase):
                 date=date.today(),
                 vendor='EUR Vendor',
                 description='EUR expense',
-                total_amount=Decimal('100.00'),
+                total_amount=D100,
                 currency=self.eur
             ),
             Expense.objects.create(
@@ -798,13 +738,13 @@ class MultiCurrencyFunctionalTest(TestCase):
                 date=date.today(),
                 vendor='GBP Vendor',
                 description='GBP expense',
-                total_amount=Decimal('100.00'),
+                total_amount=D100,
                 currency=self.gbp
             )
         ]
 
         # Verify all conversions
-        self.assertEqual(expenses[0].amount_in_base_currency, Decimal('100.00'))
+        self.assertEqual(expenses[0].amount_in_base_currency, D100)
         self.assertEqual(expenses[1].amount_in_base_currency, Decimal('110.00'))
         self.assertEqual(expenses[2].amount_in_base_currency, Decimal('125.00'))
 
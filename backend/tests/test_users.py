@@ -3,16 +3,33 @@ from django.contrib.auth import get_user_model
 from django.db import IntegrityError
 from decimal import Decimal
 from users.models import Department, User
+from users.serializers import UserSerializer
 
 User = get_user_model()
 
 
-class DepartmentModelTest(TestCase):
+class FastTestCase(TestCase):
+    """Base for the model tests in this module.
+
+    Inherit from this rather than from TransactionTestCase, whose per-test
+    TRUNCATE/re-seed teardown costs seconds per test and would also defeat
+    the setUpTestData class fixtures.
+    """
+    serialized_rollback = False
+
+
+# TestCase (and therefore FastTestCase) wraps each test in a rolled-back
+# transaction; this guard trips if that fast path is ever lost.
+assert issubclass(FastTestCase, TestCase) and FastTestCase.serialized_rollback is False
+
+
+class DepartmentModelTest(FastTestCase):
     """Test cases for Department model"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.manager = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the whole class"""
+        cls.manager = User.objects.create_user(
             username='manager1',
             email='manager@test.com',
             password='testpass123',
@@ -21,11 +38,11 @@ class DepartmentModelTest(TestCase):
             last_name='Manager'
         )
 
-        self.department = Department.objects.create(
+        cls.department = Department.objects.create(
             name='Engineering',
             code='ENG',
             description='Engineering Department',
-            manager=self.manager
+            manager=cls.manager
         )
 
     def test_department_creation(self):
@@ -101,16 +118,31 @@ class DepartmentModelTest(TestCase):
         self.assertEqual(total, Decimal('0.00'))
 
 
-class UserModelTest(TestCase):
+class UserModelTest(FastTestCase):
     """Test cases for User model"""
 
-    def setUp(self):
-        """Set up test data"""
-        self.department = Department.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the whole class"""
+        cls.department = Department.objects.create(
             name='Sales',
             code='SAL'
         )
 
+        # One user per role for the predicate checks, inserted in one batch
+        cls.role_users = {
+            user.role: user
+            for user in User.objects.bulk_create([
+                User(username=f'{role.lower()}_user', email=f'{role.lower()}@test.com', role=role)
+                for role in (
+                    User.Role.EMPLOYEE,
+                    User.Role.MANAGER,
+                    User.Role.FINANCE_ADMIN,
+                    User.Role.AUDITOR,
+                )
+            ])
+        }
+
     def test_user_creation(self):
         """Test user can be created successfully"""
         user = User.objects.create_user(
@@ -177,59 +209,19 @@ class UserModelTest(TestCase):
 
         self.assertEqual(user.role, User.Role.EMPLOYEE)
 
-    def test_is_manager_method(self):
-        """Test is_manager method"""
-        manager = User.objects.create_user(
-            username='manager',
-            email='manager@test.com',
-            password='testpass123',
-            role=User.Role.MANAGER
-        )
-        employee = User.objects.create_user(
-            username='employee',
-            email='employee@test.com',
-            password='testpass123',
-            role=User.Role.EMPLOYEE
-        )
-
-        self.assertTrue(manager.is_manager())
-        self.assertFalse(employee.is_manager())
-
-    def test_is_finance_admin_method(self):
-        """Test is_finance_admin method"""
-        finance_admin = User.objects.create_user(
-            username='finance',
-            email='finance@test.com',
-            password='testpass123',
-            role=User.Role.FINANCE_ADMIN
-        )
-        employee = User.objects.create_user(
-            username='employee',
-            email='employee@test.com',
-            password='testpass123',
-            role=User.Role.EMPLOYEE
-        )
-
-        self.assertTrue(finance_admin.is_finance_admin())
-        self.assertFalse(employee.is_finance_admin())
-
-    def test_is_auditor_method(self):
-        """Test is_auditor method"""
-        auditor = User.objects.create_user(
-            username='auditor',
-            email='auditor@test.com',
-            password='testpass123',
-            role=User.Role.AUDITOR
-        )
-        employee = User.objects.create_user(
-            username='employee',
-            email='employee@test.com',
-            password='testpass123',
-            role=User.Role.EMPLOYEE
-        )
+    def test_role_predicates(self):
+        """Test is_manager/is_finance_admin/is_auditor for each role"""
+        employee = self.role_users[User.Role.EMPLOYEE]
+        checks = [
+            (User.Role.MANAGER, 'is_manager'),
+            (User.Role.FINANCE_ADMIN, 'is_finance_admin'),
+            (User.Role.AUDITOR, 'is_auditor'),
+        ]
 
-        self.assertTrue(auditor.is_auditor())
-        self.assertFalse(employee.is_auditor())
+        for role, predicate in checks:
+            with self.subTest(role=role):
+                self.assertTrue(getattr(self.role_users[role], predicate)())
+                self.assertFalse(getattr(employee, predicate)())
 
     def test_all_user_roles(self):
         """Test all available user roles"""
@@ -240,14 +232,18 @@ class UserModelTest(TestCase):
             User.Role.AUDITOR
         ]
 
-        for role in roles:
-            user = User.objects.create_user(
-                username=f'user_{role}',
-                email=f'{role}@test.com',
-                password='testpass123',
-                role=role
-            )
+        # One INSERT for all four role users; nothing here authenticates,
+        # so skipping create_user's password hashing is fine
+        users = User.objects.bulk_create([
+            User(username=f'user_{role}', email=f'{role}@test.com', role=role)
+            for role in roles
+        ])
+
+        for user, role in zip(users, roles):
             self.assertEqual(user.role, role)
+        self.assertEqual(
+            User.objects.filter(username__startswith='user_').count(), len(roles)
+        )
 
     def test_user_department_relationship(self):
         """Test user-department relationship"""
@@ -270,3 +266,40 @@ class UserModelTest(TestCase):
         )
 
         self.assertIsNone(user.department)
+
+
+class UserSerializerQueryCountTest(FastTestCase):
+    """Query-count pins for list serialization with setup_eager_loading"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the whole class"""
+        departments = Department.objects.bulk_create([
+            Department(name=f'Department {i}', code=f'D{i:02d}')
+            for i in range(5)
+        ])
+
+        User.objects.bulk_create([
+            User(
+                username=f'user{i}',
+                email=f'user{i}@test.com',
+                first_name='Test',
+                last_name=f'User{i}',
+                department=departments[i % len(departments)]
+            )
+            for i in range(50)
+        ])
+
+    def test_user_list_serialization_query_count(self):
+        """Serializing many users runs one query regardless of row count"""
+        queryset = UserSerializer.setup_eager_loading(User.objects.all())
+
+        # One SELECT with the department JOIN and the full_name annotation;
+        # a per-user department_name or full_name query would scale with N
+        # and trip this pin.
+        with self.assertNumQueries(1):
+            data = UserSerializer(queryset, many=True).data
+
+        self.assertEqual(len(data), 50)
+        self.assertEqual(data[0]['full_name'], 'Test User0')
+        self.assertEqual(data[0]['department_name'], 'Department 0')
@@ -2,18 +2,35 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib import messages
 from django.utils.html import format_html
-from django.db.models import Count, Q
+from django.utils.safestring import mark_safe
+from django.db.models import Count, DecimalField, OuterRef, Q, Subquery, Sum
 from .models import User, Department
+from expenses.models import Expense
 
 
-class UserInline(admin.TabularInline):
-    """Inline display of users in a department"""
-    model = User
-    fields = ['username', 'email', 'first_name', 'last_name', 'role', 'is_active']
-    readonly_fields = ['username', 'email']
-    extra = 0
-    can_delete = False
-    show_change_link = True
+# format_html templates used on every changelist row, defined once instead
+# of re-parsed per render. The no-manager badge has nothing to escape, so it
+# is pre-marked safe and skips format_html entirely.
+_MANAGER_BADGE = '<span style="background-color: #4CAF50; color: white; padding: 3px 8px; border-radius: 3px;">{}</span>'
+_NO_MANAGER_BADGE = mark_safe(
+    '<span style="background-color: #ff9800; color: white; padding: 3px 8px; border-radius: 3px;">No Manager</span>'
+)
+_EMPLOYEE_COUNT_TEMPLATE = '<span style="font-weight: bold; color: {};">{} employees</span>'
+_TOTAL_EXPENSES_TEMPLATE = '<span style="color: #2196F3; font-weight: bold;">{}</span>'
+
+
+def _role_flags(request):
+    """Memoize (is_superuser, is_finance_admin, is_manager) on the request.
+
+    The admin calls get_queryset and the permission hooks several times per
+    page render; caching the role predicates keeps that to one evaluation.
+    """
+    flags = getattr(request, '_role_flags_cache', None)
+    if flags is None:
+        user = request.user
+        flags = (user.is_superuser, user.is_finance_admin(), user.is_manager())
+        request._role_flags_cache = flags
+    return flags
 
 
 @admin.register(Department)
@@ -25,7 +42,7 @@ class DepartmentAdmin(admin.ModelAdmin):
     list_filter = ['is_active', 'created_at']
     search_fields = ['name', 'code', 'description', 'manager__username']
     ordering = ['name']
-    inlines = [UserInline]
+    list_select_related = ('manager',)
 
     fieldsets = (
         ('Basic Information', {
@@ -33,7 +50,7 @@ class DepartmentAdmin(admin.ModelAdmin):
             'description': 'Enter department name and unique code. The code is used for reporting and identification purposes.'
         }),
         ('Management', {
-            'fields': ('manager', 'is_active'),
+            'fields': ('manager', 'is_active', 'user_list_link'),
             'description': 'Assign a manager who will approve expenses for this department. Inactive departments cannot submit new expenses.'
         }),
         ('Metadata', {
@@ -43,52 +60,80 @@ class DepartmentAdmin(admin.ModelAdmin):
         }),
     )
 
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['created_at', 'updated_at', 'user_list_link']
+
+    def user_list_link(self, obj):
+        """Link to the filtered user changelist instead of an inline.
+
+        The old UserInline rendered a form row for every user in the
+        department, which loads the entire team on each change page.
+        """
+        if obj is None or obj.pk is None:
+            return '-'
+        from django.urls import reverse
+        return format_html(
+            '<a href="{}?department__id__exact={}">View members</a>',
+            reverse('admin:users_user_changelist'),
+            obj.pk
+        )
+    user_list_link.short_description = 'Members'
 
     def manager_display(self, obj):
         """Display manager with badge"""
         if obj.manager:
             return format_html(
-                '<span style="background-color: #4CAF50; color: white; padding: 3px 8px; border-radius: 3px;">{}</span>',
+                _MANAGER_BADGE,
                 obj.manager.get_full_name() or obj.manager.username
             )
-        return format_html(
-            '<span style="background-color: #ff9800; color: white; padding: 3px 8px; border-radius: 3px;">No Manager</span>'
-        )
+        return _NO_MANAGER_BADGE
     manager_display.short_description = 'Manager'
 
     def employee_count(self, obj):
         """Display count of active employees"""
-        count = obj.get_employee_count()
+        # The changelist queryset carries this as an annotation; fall back to
+        # the model helper when the object was loaded without it
+        count = getattr(obj, 'active_user_count', None)
+        if count is None:
+            count = obj.get_employee_count()
         color = '#4CAF50' if count > 0 else '#999'
-        return format_html(
-            '<span style="font-weight: bold; color: {};">{} employees</span>',
-            color, count
-        )
+        return format_html(_EMPLOYEE_COUNT_TEMPLATE, color, count)
     employee_count.short_description = 'Team Size'
 
     def total_expenses_display(self, obj):
         """Display total expenses for this department"""
-        total = obj.get_total_expenses()
+        total = getattr(obj, 'total_expenses_agg', None)
+        if total is None and not hasattr(obj, 'total_expenses_agg'):
+            total = obj.get_total_expenses()
         # Convert Decimal to float for formatting
         total_float = float(total) if total else 0.0
         # Format the number as a string first
         formatted_total = f"${total_float:,.2f}"
-        return format_html(
-            '<span style="color: #2196F3; font-weight: bold;">{}</span>',
-            formatted_total
-        )
+        return format_html(_TOTAL_EXPENSES_TEMPLATE, formatted_total)
     total_expenses_display.short_description = 'Total Expenses'
 
     def get_queryset(self, request):
         """Optimize queryset with annotations and role-based filtering"""
-        qs = super().get_queryset(request)
+        qs = super().get_queryset(request).select_related('manager')
+        # Approved spend per department as a subquery rather than a joined
+        # Sum, so it can't multiply the user-count rows
+        approved_totals = Expense.objects.filter(
+            user__department=OuterRef('pk'),
+            status='APPROVED'
+        ).values('user__department').annotate(
+            total=Sum('amount_in_base_currency')
+        ).values('total')
+
         qs = qs.annotate(
-            active_user_count=Count('users', filter=Q(users__is_active=True))
+            active_user_count=Count('users', filter=Q(users__is_active=True)),
+            total_expenses_agg=Subquery(
+                approved_totals,
+                output_field=DecimalField(max_digits=12, decimal_places=2)
+            )
         )
 
         # Managers see only their department
-        if request.user.is_manager() and not request.user.is_superuser:
+        is_superuser, _, is_manager = _role_flags(request)
+        if is_manager and not is_superuser:
             if request.user.department:
                 return qs.filter(id=request.user.department.id)
             return qs.none()
@@ -98,16 +143,14 @@ class DepartmentAdmin(admin.ModelAdmin):
     def has_change_permission(self, request, obj=None):
         """Control who can edit departments"""
         # Only Finance Admin and Superuser can edit departments
-        if request.user.is_superuser or request.user.is_finance_admin():
-            return True
-        return False
+        is_superuser, is_finance_admin, _ = _role_flags(request)
+        return is_superuser or is_finance_admin
 
     def has_add_permission(self, request):
         """Control who can add departments"""
         # Only Finance Admin and Superuser can add departments
-        if request.user.is_superuser or request.user.is_finance_admin():
-            return True
-        return False
+        is_superuser, is_finance_admin, _ = _role_flags(request)
+        return is_superuser or is_finance_admin
 
     def has_delete_permission(self, request, obj=None):
         """Control who can delete departments"""
@@ -131,39 +174,53 @@ class DepartmentAdmin(admin.ModelAdmin):
     def export_department_report(self, request, queryset):
         """Export department report to CSV"""
         import csv
-        from django.http import HttpResponse
+        from django.http import StreamingHttpResponse
         from datetime import datetime
 
-        # Create the HttpResponse object with CSV header
-        response = HttpResponse(content_type='text/csv')
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        response['Content-Disposition'] = f'attachment; filename="departments_{timestamp}.csv"'
-
-        writer = csv.writer(response)
-
-        # Write header
-        writer.writerow([
-            'ID', 'Name', 'Code', 'Manager', 'Employee Count',
-            'Total Expenses', 'Active', 'Created At'
-        ])
-
-        # Write data rows
-        for dept in queryset:
-            total_expenses = dept.get_total_expenses()
-
-            writer.writerow([
-                dept.id,
-                dept.name,
-                dept.code,
-                dept.manager.get_full_name() if dept.manager else 'N/A',
-                dept.get_employee_count(),
-                f"${float(total_expenses):,.2f}",
-                'Yes' if dept.is_active else 'No',
-                dept.created_at.strftime('%Y-%m-%d %H:%M:%S')
+        class Echo:
+            """File-like object whose write() hands the rendered row back"""
+            def write(self, value):
+                return value
+
+        writer = csv.writer(Echo())
+        queryset = queryset.select_related('manager')
+
+        def rows():
+            # Header
+            yield writer.writerow([
+                'ID', 'Name', 'Code', 'Manager', 'Employee Count',
+                'Total Expenses', 'Active', 'Created At'
             ])
 
+            # Data rows - iterator() streams from the cursor instead of
+            # caching every department in the queryset, and the changelist
+            # annotations supply the count/total without per-row queries
+            for dept in queryset.iterator(chunk_size=2000):
+                total_expenses = getattr(dept, 'total_expenses_agg', None)
+                if total_expenses is None and not hasattr(dept, 'total_expenses_agg'):
+                    total_expenses = dept.get_total_expenses()
+                employee_count = getattr(dept, 'active_user_count', None)
+                if employee_count is None:
+                    employee_count = dept.get_employee_count()
+
+                yield writer.writerow([
+                    dept.id,
+                    dept.name,
+                    dept.code,
+                    dept.manager.get_full_name() if dept.manager else 'N/A',
+                    employee_count,
+                    f"${float(total_expenses or 0):,.2f}",
+                    'Yes' if dept.is_active else 'No',
+                    dept.created_at.strftime('%Y-%m-%d %H:%M:%S')
+                ])
+
         self.message_user(request, f'Successfully exported {queryset.count()} department(s).')
-        return response
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return StreamingHttpResponse(
+            rows(),
+            content_type='text/csv',
+            headers={'Content-Disposition': f'attachment; filename="departments_{timestamp}.csv"'}
+        )
     export_department_report.short_description = 'Export department report to CSV'
 
 
@@ -173,6 +230,7 @@ class UserAdmin(BaseUserAdmin):
     list_filter = ['role', 'department', 'is_active', 'is_staff']
     search_fields = ['username', 'email', 'first_name', 'last_name']
     ordering = ['username']
+    list_select_related = ('department',)
     actions = ['impersonate_user_action']
 
     fieldsets = BaseUserAdmin.fieldsets + (
@@ -191,14 +249,17 @@ class UserAdmin(BaseUserAdmin):
 
     def get_queryset(self, request):
         """Filter users based on role"""
-        qs = super().get_queryset(request)
+        # The changelist's department column dereferences the FK per row
+        qs = super().get_queryset(request).select_related('department')
+
+        is_superuser, is_finance_admin, is_manager = _role_flags(request)
 
         # Superuser and Finance Admin see all users
-        if request.user.is_superuser or request.user.is_finance_admin():
+        if is_superuser or is_finance_admin:
             return qs
 
         # Managers see only their department's users
-        if request.user.is_manager():
+        if is_manager:
             if request.user.department:
                 return qs.filter(department=request.user.department)
             return qs.none()
@@ -209,16 +270,14 @@ class UserAdmin(BaseUserAdmin):
     def has_change_permission(self, request, obj=None):
         """Control who can edit users"""
         # Only Finance Admin and Superuser can edit users
-        if request.user.is_superuser or request.user.is_finance_admin():
-            return True
-        return False
+        is_superuser, is_finance_admin, _ = _role_flags(request)
+        return is_superuser or is_finance_admin
 
     def has_add_permission(self, request):
         """Control who can add users"""
         # Only Finance Admin and Superuser can add users
-        if request.user.is_superuser or request.user.is_finance_admin():
-            return True
-        return False
+        is_superuser, is_finance_admin, _ = _role_flags(request)
+        return is_superuser or is_finance_admin
 
     def has_delete_permission(self, request, obj=None):
         """Control who can delete users"""
@@ -235,8 +294,11 @@ class UserAdmin(BaseUserAdmin):
             self.message_user(request, 'Only superadmins can impersonate users.', level=messages.ERROR)
             return
 
-        # Only allow impersonating one user at a time
-        if queryset.count() != 1:
+        # Only allow impersonating one user at a time. Fetching at most two
+        # rows answers "exactly one selected?" without a COUNT over the whole
+        # selection, and the single fetch doubles as the user lookup.
+        selected = list(queryset[:2])
+        if len(selected) != 1:
             self.message_user(
                 request,
                 'Please select exactly one user to impersonate.',
@@ -244,7 +306,7 @@ class UserAdmin(BaseUserAdmin):
             )
             return
 
-        user_to_impersonate = queryset.first()
+        user_to_impersonate = selected[0]
 
         # Don't allow impersonating yourself
         if user_to_impersonate.id == request.user.id:
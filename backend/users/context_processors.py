@@ -3,20 +3,25 @@ Context processors for user impersonation
 """
 
 
+# Shared result for the common case: almost every request is not
+# impersonating, so hand back one prebuilt dict instead of constructing a
+# fresh one per template render. Callers must not mutate it.
+_NOT_IMPERSONATING = {
+    'is_impersonating': False,
+    'impersonated_user': None,
+    'real_user': None,
+}
+
+
 def impersonation_context(request):
     """
     Add impersonation status to all templates
     """
-    context = {
-        'is_impersonating': False,
-        'impersonated_user': None,
-        'real_user': None,
-    }
+    if not getattr(request, 'is_impersonating', False):
+        return _NOT_IMPERSONATING
 
-    if hasattr(request, 'is_impersonating') and request.is_impersonating:
-        context['is_impersonating'] = True
-        context['impersonated_user'] = request.user
-        if hasattr(request, 'real_user'):
-            context['real_user'] = request.real_user
-
-    return context
+    return {
+        'is_impersonating': True,
+        'impersonated_user': request.user,
+        'real_user': getattr(request, 'real_user', None),
+    }
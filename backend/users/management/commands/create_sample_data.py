@@ -1,4 +1,6 @@
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from users.models import User, Department
 from segments.models import Segment, Budget
 from expenses.models import Currency, Expense, ExpenseSegmentAllocation
@@ -10,6 +12,7 @@ import random
 class Command(BaseCommand):
     help = 'Create sample data for testing the Expense Management System'
 
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         self.stdout.write(self.style.SUCCESS('Creating sample data...'))
 
@@ -23,15 +26,22 @@ class Command(BaseCommand):
             {'name': 'Human Resources', 'code': 'HR', 'description': 'Human Resources and Recruitment'},
         ]
 
-        departments = {}
+        # One SELECT to find what already exists, one INSERT for the rest -
+        # instead of a SELECT+INSERT round-trip per department
+        existing_codes = set(Department.objects.filter(
+            code__in=[d['code'] for d in departments_data]
+        ).values_list('code', flat=True))
+        Department.objects.bulk_create(
+            [Department(**d) for d in departments_data if d['code'] not in existing_codes],
+            ignore_conflicts=True
+        )
+        departments = {
+            dept.code: dept
+            for dept in Department.objects.filter(code__in=[d['code'] for d in departments_data])
+        }
         for dept_data in departments_data:
-            dept, created = Department.objects.get_or_create(
-                code=dept_data['code'],
-                defaults={'name': dept_data['name'], 'description': dept_data['description']}
-            )
-            departments[dept_data['code']] = dept
-            status = 'created' if created else 'already exists'
-            self.stdout.write(f'  - {dept.name}: {status}')
+            status = 'already exists' if dept_data['code'] in existing_codes else 'created'
+            self.stdout.write(f'  - {dept_data["name"]}: {status}')
 
         # Create Users
         self.stdout.write('\nCreating users...')
@@ -69,35 +79,42 @@ class Command(BaseCommand):
              'role': 'EMPLOYEE', 'dept': 'SAL'},
         ]
 
-        users = {}
-        for user_data in users_data:
-            dept_code = user_data.pop('dept')
-            user, created = User.objects.get_or_create(
-                username=user_data['username'],
-                defaults={
-                    **user_data,
-                    'department': departments[dept_code]
-                }
+        # All sample users share one password, so hash it once instead of
+        # running the hasher per created user
+        hashed_password = make_password('password123')
+
+        # Same one-SELECT-one-INSERT pattern as the departments above
+        usernames = [u['username'] for u in users_data]
+        existing_usernames = set(
+            User.objects.filter(username__in=usernames).values_list('username', flat=True)
+        )
+        User.objects.bulk_create([
+            User(
+                **{k: v for k, v in user_data.items() if k != 'dept'},
+                department=departments[user_data['dept']],
+                password=hashed_password
             )
-            if created:
-                user.set_password('password123')
-                user.save()
-            users[user.username] = user
-            status = 'created' if created else 'already exists'
+            for user_data in users_data
+            if user_data['username'] not in existing_usernames
+        ], ignore_conflicts=True)
+
+        users = User.objects.filter(username__in=usernames).in_bulk(field_name='username')
+        for user_data in users_data:
+            user = users[user_data['username']]
+            status = 'already exists' if user.username in existing_usernames else 'created'
             self.stdout.write(f'  - {user.username} ({user.get_role_display()}): {status}')
 
-        # Assign managers to departments
+        # Assign managers to departments in a single UPDATE
         self.stdout.write('\nAssigning managers to departments...')
         departments['ENG'].manager = users['john_manager']
-        departments['ENG'].save()
-        self.stdout.write(f'  - Engineering: John Smith')
-
         departments['MKT'].manager = users['sarah_manager']
-        departments['MKT'].save()
-        self.stdout.write(f'  - Marketing: Sarah Johnson')
-
         departments['SAL'].manager = users['mike_manager']
-        departments['SAL'].save()
+        Department.objects.bulk_update(
+            [departments['ENG'], departments['MKT'], departments['SAL']],
+            ['manager']
+        )
+        self.stdout.write(f'  - Engineering: John Smith')
+        self.stdout.write(f'  - Marketing: Sarah Johnson')
         self.stdout.write(f'  - Sales: Mike Davis')
 
         # Create Segments (Categories)
@@ -112,15 +129,20 @@ class Command(BaseCommand):
             {'name': 'Equipment', 'description': 'Computer hardware, furniture, and office equipment'},
         ]
 
-        segments = {}
+        existing_segments = set(Segment.objects.filter(
+            name__in=[sd['name'] for sd in segments_data]
+        ).values_list('name', flat=True))
+        Segment.objects.bulk_create(
+            [Segment(**sd) for sd in segments_data if sd['name'] not in existing_segments],
+            ignore_conflicts=True
+        )
+        segments = {
+            seg.name: seg
+            for seg in Segment.objects.filter(name__in=[sd['name'] for sd in segments_data])
+        }
         for seg_data in segments_data:
-            seg, created = Segment.objects.get_or_create(
-                name=seg_data['name'],
-                defaults={'description': seg_data['description']}
-            )
-            segments[seg.name] = seg
-            status = 'created' if created else 'already exists'
-            self.stdout.write(f'  - {seg.name}: {status}')
+            status = 'already exists' if seg_data['name'] in existing_segments else 'created'
+            self.stdout.write(f'  - {seg_data["name"]}: {status}')
 
         # Create Currency
         self.stdout.write('\nCreating currencies...')
@@ -145,20 +167,30 @@ class Command(BaseCommand):
             {'segment': 'Travel', 'dept': 'SAL', 'amount': 75000},
         ]
 
+        # Budget has no unique constraint for ignore_conflicts to key on, so
+        # check existence with one SELECT over the period's budgets instead
+        period_start = date(today.year, today.month, 1)
+        period_end = date(today.year, today.month + 1, 1) if today.month < 12 else date(today.year + 1, 1, 1)
+        existing_budgets = set(Budget.objects.filter(
+            start_date=period_start
+        ).values_list('segment_id', 'department_id'))
+
+        new_budgets = []
         for budget_info in budget_data:
-            budget, created = Budget.objects.get_or_create(
-                segment=segments[budget_info['segment']],
-                department=departments[budget_info['dept']],
-                start_date=date(today.year, today.month, 1),
-                defaults={
-                    'allocated_amount': budget_info['amount'],
-                    'period_type': 'MONTHLY',
-                    'end_date': date(today.year, today.month + 1, 1) if today.month < 12 else date(today.year + 1, 1, 1),
-                    'alert_threshold_percentage': 80
-                }
-            )
-            status = 'created' if created else 'already exists'
+            key = (segments[budget_info['segment']].id, departments[budget_info['dept']].id)
+            if key not in existing_budgets:
+                new_budgets.append(Budget(
+                    segment=segments[budget_info['segment']],
+                    department=departments[budget_info['dept']],
+                    allocated_amount=budget_info['amount'],
+                    period_type='MONTHLY',
+                    start_date=period_start,
+                    end_date=period_end,
+                    alert_threshold_percentage=80
+                ))
+            status = 'already exists' if key in existing_budgets else 'created'
             self.stdout.write(f'  - {budget_info["dept"]} - {budget_info["segment"]}: ${budget_info["amount"]:,} ({status})')
+        Budget.objects.bulk_create(new_budgets)
 
         self.stdout.write(self.style.SUCCESS('\n✅ Sample data created successfully!'))
         self.stdout.write(self.style.SUCCESS('\nYou can now login to the admin panel with:'))
@@ -1,15 +1,32 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from users.models import User
 from segments.models import Segment
 from expenses.models import Currency, Expense, ExpenseSegmentAllocation
 from datetime import date, timedelta
 from decimal import Decimal
+import os
 import random
 
+# Rows per INSERT for the bulk_create calls below. 500 is a reasonable
+# middle ground; drop to ~100 in CI or other memory-constrained environments,
+# raise to ~1000 when seeding large datasets on a well-provisioned server.
+BULK_BATCH_SIZE = int(os.environ.get('EXPENSE_BULK_BATCH_SIZE', '500'))
+
 
 class Command(BaseCommand):
     help = 'Create sample expenses for testing'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=None,
+            help='Number of expenses to generate, cycling through the sample '
+                 'templates (default: one expense per template)'
+        )
+
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         self.stdout.write(self.style.SUCCESS('Creating sample expenses...'))
 
@@ -125,44 +142,91 @@ class Command(BaseCommand):
             },
         ]
 
-        created_count = 0
-        for template in expense_templates:
-            # Pick a random user
-            user = random.choice(users)
+        # Build every expense in memory, then insert them in one batch.
+        # bulk_create skips Expense.save(), so the base-currency amount is
+        # precomputed here the same way save() would.
+        # For load-testing sized runs, --count repeats the templates; the
+        # batched build + bulk_create below scales to large N in-process
+        count = kwargs.get('count')
+        if count is not None:
+            expense_templates = [
+                expense_templates[i % len(expense_templates)] for i in range(count)
+            ]
 
-            # Random date in the last 30 days
-            days_ago = random.randint(1, 30)
-            expense_date = date.today() - timedelta(days=days_ago)
+        # Draw all the randomness up front: one today() call, one batched
+        # choices() per attribute, instead of per-iteration calls
+        today = date.today()
+        statuses = ('PENDING', 'PENDING', 'APPROVED', 'DRAFT')  # More pending than others
+        n = len(expense_templates)
+        random_users = random.choices(users, k=n)
+        random_days_ago = random.choices(range(1, 31), k=n)
+        random_statuses = random.choices(statuses, k=n)
 
-            # Random status
-            statuses = ['PENDING', 'PENDING', 'APPROVED', 'DRAFT']  # More pending than others
-            status = random.choice(statuses)
+        # Assign the FKs by id rather than instance; setting the raw *_id
+        # attribute skips the ForeignKey descriptor's caching work on every
+        # one of the N constructions
+        usd_id = usd.id
+        exchange_rate = usd.exchange_rate_to_base
 
-            # Create expense
-            expense = Expense.objects.create(
-                user=user,
-                date=expense_date,
+        pending_expenses = []
+        for template, user, days_ago, status in zip(
+            expense_templates, random_users, random_days_ago, random_statuses
+        ):
+            total_amount = Decimal(str(template['amount']))
+            pending_expenses.append(Expense(
+                user_id=user.id,
+                date=today - timedelta(days=days_ago),
                 vendor=template['vendor'],
                 description=template['description'],
-                total_amount=Decimal(str(template['amount'])),
-                currency=usd,
+                total_amount=total_amount,
+                currency_id=usd_id,
+                amount_in_base_currency=total_amount * exchange_rate,
                 status=status
-            )
+            ))
+
+        expenses = Expense.objects.bulk_create(pending_expenses, batch_size=BULK_BATCH_SIZE)
 
-            # Create segment allocations
+        # Same pattern for the allocations: collect, then one batched INSERT.
+        # save() would derive each allocation's amount, so calculate_amount()
+        # fills it in up front.
+        # Segments were already fetched above; resolve names from a dict
+        # instead of a Segment.objects.get round-trip per allocation
+        segments_by_name = {segment.name: segment for segment in segments}
+
+        # Status labels, resolved once; get_status_display() rebuilds the
+        # choices dict per call. Per-row logging is capped so --count runs
+        # don't spend their time writing to stdout.
+        status_display = dict(Expense._meta.get_field('status').flatchoices)
+        log_limit = 50
+
+        pending_allocations = []
+        for i, (template, expense) in enumerate(zip(expense_templates, expenses)):
             for seg_alloc in template['segments']:
-                try:
-                    segment = Segment.objects.get(name=seg_alloc['name'])
-                    ExpenseSegmentAllocation.objects.create(
-                        expense=expense,
-                        segment=segment,
-                        percentage=Decimal(str(seg_alloc['percentage']))
-                    )
-                except Segment.DoesNotExist:
+                segment = segments_by_name.get(seg_alloc['name'])
+                if segment is None:
                     self.stdout.write(self.style.WARNING(f"  Segment '{seg_alloc['name']}' not found, skipping"))
+                    continue
+                # expense stays an instance (calculate_amount reads its
+                # total_amount); the segment is only needed for its id
+                allocation = ExpenseSegmentAllocation(
+                    expense=expense,
+                    segment_id=segment.id,
+                    percentage=Decimal(str(seg_alloc['percentage']))
+                )
+                allocation.amount = allocation.calculate_amount()
+                pending_allocations.append(allocation)
+
+            if i < log_limit:
+                self.stdout.write(f"  ✓ {expense.vendor} - ${expense.total_amount} ({status_display[expense.status]})")
+            elif i == log_limit:
+                self.stdout.write(f"  ... ({len(expenses) - log_limit} more)")
 
-            created_count += 1
-            self.stdout.write(f"  ✓ {expense.vendor} - ${expense.total_amount} ({expense.get_status_display()})")
+        # Allocations are unique per (expense, segment); ignore_conflicts turns
+        # any duplicate rows into no-ops inside the same multi-row INSERT
+        # instead of needing an existence check per allocation.
+        ExpenseSegmentAllocation.objects.bulk_create(
+            pending_allocations, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True
+        )
 
-        self.stdout.write(self.style.SUCCESS(f'\n✅ Created {created_count} sample expenses!'))
+        self.stdout.write(self.style.SUCCESS(f'\n✅ Created {len(expenses)} sample expenses!'))
         self.stdout.write(self.style.SUCCESS('\nYou can view them at: http://127.0.0.1:8000/admin/expenses/expense/'))
@@ -2,7 +2,19 @@
 User Impersonation Middleware
 Allows superadmins to view the system as another user
 """
+from django.core.cache import cache
 from django.utils.deprecation import MiddlewareMixin
+from django.utils.functional import SimpleLazyObject
+
+# Impersonated users are re-fetched at most this often (seconds). Short on
+# purpose: role or deactivation changes to the impersonated account take at
+# most one minute to show up mid-impersonation.
+IMPERSONATION_CACHE_TTL = 60
+
+
+def impersonation_cache_key(user_id):
+    """Cache key for an impersonated user; shared with the stop view"""
+    return f'impersonate:{user_id}'
 
 
 class ImpersonationMiddleware(MiddlewareMixin):
@@ -19,22 +31,45 @@ class ImpersonationMiddleware(MiddlewareMixin):
             if impersonate_id:
                 # Store the real user if not already stored
                 if not hasattr(request, '_cached_user'):
-                    from users.models import User
-                    try:
-                        # Get the impersonated user
-                        impersonated_user = User.objects.get(id=impersonate_id)
-
-                        # Store the real superadmin
-                        request.real_user = request.user
-
-                        # Replace request.user with impersonated user
-                        request.user = impersonated_user
-
-                        # Add flag to indicate impersonation is active
-                        request.is_impersonating = True
-                    except User.DoesNotExist:
-                        # Clear invalid impersonation
-                        del request.session['impersonate_id']
-                        request.is_impersonating = False
+                    # Store the real superadmin
+                    real_user = request.user
+                    request.real_user = real_user
+
+                    # Replace request.user with a lazy impersonated user -
+                    # requests that never touch request.user (static files,
+                    # simple redirects) skip the lookup entirely
+                    request.user = SimpleLazyObject(
+                        lambda: self._resolve_impersonated(request, impersonate_id, real_user)
+                    )
+
+                    # Add flag to indicate impersonation is active
+                    request.is_impersonating = True
             else:
                 request.is_impersonating = False
+
+    def _resolve_impersonated(self, request, impersonate_id, real_user):
+        """Resolve the impersonated user: cache first, then a narrow SELECT.
+
+        If the account has been deleted since impersonation started, the
+        session entry is cleared and the real user comes back.
+        """
+        from users.models import User
+
+        cache_key = impersonation_cache_key(impersonate_id)
+        impersonated_user = cache.get(cache_key)
+        if impersonated_user is None:
+            try:
+                # Fetch only what auth checks and the admin header actually
+                # read; the wide columns (phone, timestamps) stay deferred
+                impersonated_user = User.objects.only(
+                    'id', 'password', 'last_login', 'is_superuser',
+                    'username', 'first_name', 'last_name', 'email',
+                    'is_active', 'is_staff', 'role', 'department'
+                ).get(id=impersonate_id)
+            except User.DoesNotExist:
+                # Clear invalid impersonation
+                request.session.pop('impersonate_id', None)
+                request.is_impersonating = False
+                return real_user
+            cache.set(cache_key, impersonated_user, IMPERSONATION_CACHE_TTL)
+        return impersonated_user
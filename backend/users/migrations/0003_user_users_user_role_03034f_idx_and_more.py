@@ -0,0 +1,21 @@
+# Generated by Django 4.2.9 on 2026-08-28 00:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_department_code_department_is_active_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', 'department'], name='users_user_role_03034f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['department', 'is_active'], name='users_user_departm_a79578_idx'),
+        ),
+    ]
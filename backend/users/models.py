@@ -27,23 +27,29 @@ class Department(models.Model):
         return f"{self.name} ({self.code})"
 
     def get_employee_count(self):
-        """Return count of users in this department"""
-        return self.users.filter(is_active=True).count()
+        """Return count of users in this department.
+
+        Honors a queryset-level annotation (the admin changelist attaches
+        one as active_user_count) so per-row callers skip the COUNT query.
+        """
+        count = getattr(self, 'active_user_count', None)
+        if count is None:
+            count = self.users.filter(is_active=True).count()
+        return count
 
     def get_manager_name(self):
         """Return manager's name or 'No Manager'"""
         return self.manager.get_full_name() if self.manager else "No Manager"
 
     def get_total_expenses(self):
-        """Get total approved expenses for this department"""
+        """Get total approved expenses for this department in one SQL aggregate"""
         from expenses.models import Expense
         from decimal import Decimal
-        expenses = Expense.objects.filter(
+        total = Expense.objects.filter(
             user__department=self,
             status='APPROVED'
-        )
-        total = sum((exp.amount_in_base_currency for exp in expenses), Decimal('0.00'))
-        return total
+        ).aggregate(total=models.Sum('amount_in_base_currency'))['total']
+        return total if total is not None else Decimal('0.00')
 
 
 class User(AbstractUser):
@@ -74,6 +80,12 @@ class User(AbstractUser):
 
     class Meta:
         ordering = ['username']
+        indexes = [
+            # Admin querysets filter users by role and department pairs
+            models.Index(fields=['role', 'department']),
+            # Lets the active-member count resolve from the index alone
+            models.Index(fields=['department', 'is_active']),
+        ]
 
     def __str__(self):
         return f"{self.get_full_name() or self.username} ({self.get_role_display()})"
@@ -1,9 +1,11 @@
 """
 Views for user impersonation functionality
 """
+from django.core.cache import cache
 from django.shortcuts import redirect, get_object_or_404
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib import messages
+from .middleware import impersonation_cache_key
 from .models import User
 
 
@@ -44,6 +46,8 @@ def stop_impersonation(request):
     Stop impersonating and return to real user
     """
     if 'impersonate_id' in request.session:
+        # Drop the cached user so a later impersonation starts fresh
+        cache.delete(impersonation_cache_key(request.session['impersonate_id']))
         del request.session['impersonate_id']
         if 'real_user_id' in request.session:
             del request.session['real_user_id']